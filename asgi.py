@@ -0,0 +1,3 @@
+from budget_app.asgi import create_asgi_app
+
+app = create_asgi_app()
@@ -0,0 +1,206 @@
+"""Compare concurrent GET throughput and memory of the WSGI and ASGI entry points.
+
+Both servers are started against the same seeded SQLite file and hit with the
+same mix of list requests. Memory is sampled from ``/proc`` (Linux only).
+
+Usage::
+
+    python benchmarks/load_test.py --requests 2000 --concurrency 100
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from budget_app import create_app, db  # noqa: E402
+from budget_app.cli import seed_debts, seed_incomes, seed_sources  # noqa: E402
+from budget_app.models import Expense, Source  # noqa: E402
+
+PATHS = ["/sources", "/expenses", "/incomes", "/debts"]
+
+
+@dataclass
+class Result:
+    name: str
+    requests: int
+    errors: int
+    elapsed: float
+    latencies: list[float]
+    idle_rss_kb: int
+    peak_rss_kb: int
+
+    def row(self) -> str:
+        latencies = sorted(self.latencies)
+        p50 = statistics.median(latencies) * 1000
+        p95 = latencies[int(len(latencies) * 0.95) - 1] * 1000
+        return (
+            f"{self.name:<5} {self.requests / self.elapsed:>9.1f} {p50:>8.1f} {p95:>8.1f} "
+            f"{self.errors:>6} {self.idle_rss_kb / 1024:>9.1f} {self.peak_rss_kb / 1024:>9.1f}"
+        )
+
+
+def seed_database(uri: str, rows: int) -> None:
+    app = create_app({"SQLALCHEMY_DATABASE_URI": uri})
+    with app.app_context():
+        db.create_all()
+        seed_sources()
+        seed_incomes()
+        seed_debts()
+        db.session.flush()
+        sources = Source.query.all()
+        today = date.today()
+        db.session.add_all(
+            Expense(
+                description=f"Harcama {index}",
+                amount=Decimal(random.randint(100, 500000)) / 100,
+                date=today - timedelta(days=index % 365),
+                category="Benchmark",
+                source=sources[index % len(sources)],
+            )
+            for index in range(rows)
+        )
+        db.session.commit()
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def rss_kb(pid: int, field: str = "VmRSS") -> int:
+    with open(f"/proc/{pid}/status", encoding="ascii") as handle:
+        for line in handle:
+            if line.startswith(f"{field}:"):
+                return int(line.split()[1])
+    return 0
+
+
+async def fetch(port: int, path: str) -> int:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n".encode())
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    await writer.wait_closed()
+    return int(response.split(b" ", 2)[1])
+
+
+async def wait_until_ready(port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if await fetch(port, "/health") == 200:
+                return
+        except (OSError, IndexError, ValueError):
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+async def run_load(name: str, pid: int, port: int, requests: int, concurrency: int) -> Result:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors = 0
+    peak = 0
+    done = asyncio.Event()
+
+    async def sample_memory() -> None:
+        nonlocal peak
+        while not done.is_set():
+            peak = max(peak, rss_kb(pid))
+            await asyncio.sleep(0.05)
+
+    async def one(index: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                status = await fetch(port, PATHS[index % len(PATHS)])
+            except (OSError, IndexError, ValueError):
+                status = 0
+            latencies.append(time.perf_counter() - started)
+            if status != 200:
+                errors += 1
+
+    for index in range(len(PATHS) * 5):
+        await one(index)
+    idle = rss_kb(pid)
+
+    sampler = asyncio.create_task(sample_memory())
+    started = time.perf_counter()
+    latencies.clear()
+    errors = 0
+    await asyncio.gather(*(one(index) for index in range(requests)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await sampler
+
+    peak = max(peak, rss_kb(pid))
+    return Result(name, requests, errors, elapsed, latencies, idle, peak)
+
+
+def server_command(name: str, uri: str, port: int) -> list[str]:
+    config = repr({"SQLALCHEMY_DATABASE_URI": uri})
+    if name == "wsgi":
+        app = f"budget_app:create_app({config})"
+        return [sys.executable, "-m", "flask", "--app", app, "run", "--port", str(port), "--with-threads"]
+    script = (
+        "import uvicorn\n"
+        "from budget_app.asgi import create_asgi_app\n"
+        f"uvicorn.run(create_asgi_app({config}), port={port}, log_level='warning')\n"
+    )
+    return [sys.executable, "-c", script]
+
+
+def benchmark(name: str, uri: str, requests: int, concurrency: int) -> Result:
+    port = free_port()
+    server = subprocess.Popen(
+        server_command(name, uri, port),
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        asyncio.run(wait_until_ready(port))
+        return asyncio.run(run_load(name, server.pid, port, requests, concurrency))
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--rows", type=int, default=500, help="number of seeded expenses")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        uri = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        seed_database(uri, args.rows)
+
+        results = [benchmark(name, uri, args.requests, args.concurrency) for name in ("wsgi", "asgi")]
+
+    print(f"{args.requests} requests, concurrency {args.concurrency}, {args.rows} expenses")
+    print(f"{'app':<5} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'errors':>6} {'idle MiB':>9} {'peak MiB':>9}")
+    for result in results:
+        print(result.row())
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,10 @@ def create_app(test_config: dict | None = None) -> Flask:
 
     db.init_app(app)
 
+    from .currency import RateCache
+
+    app.extensions["rate_cache"] = RateCache()
+
     from . import routes  # noqa: WPS433  (import inside function for factory pattern)
     app.register_blueprint(routes.bp)
 
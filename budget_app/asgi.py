@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import os
+from typing import Any
+
+from asgiref.wsgi import WsgiToAsgi
+from quart import Blueprint, Quart, abort, current_app, jsonify, request
+from sqlalchemy import select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import joinedload
+from werkzeug.exceptions import HTTPException
+from werkzeug.routing import RoutingException
+
+from . import create_app
+from .currency import (
+    ConversionError,
+    RateCache,
+    conversion_target,
+    rate_series_query,
+    rate_version_query,
+    serialize_records,
+)
+from .models import Debt, Expense, Income, Source
+
+bp = Blueprint("async_api", __name__)
+
+
+@bp.errorhandler(ConversionError)
+async def conversion_error(error: ConversionError) -> Any:
+    return jsonify({"error": str(error)}), 400
+
+
+@bp.get("/sources")
+async def sources() -> Any:
+    async with open_session() as session:
+        all_sources = await session.scalars(select(Source).order_by(Source.name))
+        return jsonify([source.to_dict() for source in all_sources])
+
+
+@bp.get("/sources/<int:source_id>")
+async def source_detail(source_id: int) -> Any:
+    async with open_session() as session:
+        source = await session.get(Source, source_id)
+    if source is None:
+        abort(404)
+    return jsonify(source.to_dict())
+
+
+@bp.get("/expenses")
+async def expenses() -> Any:
+    target = conversion_target(request.args)
+    async with open_session() as session:
+        all_expenses = list(
+            await session.scalars(
+                select(Expense).options(joinedload(Expense.source)).order_by(Expense.date.desc())
+            )
+        )
+        cache = await get_rate_cache(session, target)
+    return jsonify(serialize_records(all_expenses, "date", target, cache))
+
+
+@bp.get("/expenses/<int:expense_id>")
+async def expense_detail(expense_id: int) -> Any:
+    async with open_session() as session:
+        expense = await session.get(
+            Expense, expense_id, options=[joinedload(Expense.source)]
+        )
+    if expense is None:
+        abort(404)
+    return jsonify(expense.to_dict())
+
+
+@bp.get("/incomes")
+async def incomes() -> Any:
+    target = conversion_target(request.args)
+    async with open_session() as session:
+        all_incomes = list(
+            await session.scalars(select(Income).order_by(Income.received_date.desc()))
+        )
+        cache = await get_rate_cache(session, target)
+    return jsonify(serialize_records(all_incomes, "received_date", target, cache))
+
+
+@bp.get("/incomes/<int:income_id>")
+async def income_detail(income_id: int) -> Any:
+    async with open_session() as session:
+        income = await session.get(Income, income_id)
+    if income is None:
+        abort(404)
+    return jsonify(income.to_dict())
+
+
+@bp.get("/debts")
+async def debts() -> Any:
+    target = conversion_target(request.args)
+    async with open_session() as session:
+        all_debts = list(
+            await session.scalars(
+                select(Debt).order_by(Debt.due_date.is_(None), Debt.due_date)
+            )
+        )
+        cache = await get_rate_cache(session, target)
+    return jsonify(serialize_records(all_debts, "due_date", target, cache))
+
+
+@bp.get("/debts/<int:debt_id>")
+async def debt_detail(debt_id: int) -> Any:
+    async with open_session() as session:
+        debt = await session.get(Debt, debt_id)
+    if debt is None:
+        abort(404)
+    return jsonify(debt.to_dict())
+
+
+def open_session() -> AsyncSession:
+    return current_app.extensions["async_session"]()
+
+
+async def get_rate_cache(session: AsyncSession, target: str | None) -> RateCache | None:
+    """Return the app's rate cache when converting, reloading it if rates changed."""
+    if target is None:
+        return None
+    cache: RateCache = current_app.extensions["rate_cache"]
+    version = tuple((await session.execute(rate_version_query())).one())
+    if not cache.is_current(version):
+        cache.fill(await session.execute(rate_series_query()), version)
+    return cache
+
+
+def async_database_uri(uri: str, instance_path: str) -> str:
+    """Map the sync SQLite URI onto aiosqlite, resolving it like Flask-SQLAlchemy does."""
+    url = make_url(uri)
+    if url.get_backend_name() != "sqlite":
+        return uri
+    database = url.database
+    if database and database != ":memory:" and not os.path.isabs(database):
+        database = os.path.join(instance_path, database)
+    return url.set(drivername="sqlite+aiosqlite", database=database).render_as_string(
+        hide_password=False
+    )
+
+
+class ReadWriteDispatcher:
+    """ASGI app that serves async GET routes and hands everything else to Flask.
+
+    Requests that match a route of ``read_app`` are handled on the event loop;
+    writes and any endpoint without an async counterpart run through the
+    existing WSGI app in a worker thread.
+    """
+
+    def __init__(self, read_app: Quart, wsgi_app: Any) -> None:
+        self.read_app = read_app
+        self.write_app = WsgiToAsgi(wsgi_app)
+        self._adapter = read_app.url_map.bind("localhost")
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] == "http" and not self._is_async_route(scope):
+            await self.write_app(scope, receive, send)
+            return
+        await self.read_app(scope, receive, send)
+
+    def _is_async_route(self, scope: dict[str, Any]) -> bool:
+        try:
+            self._adapter.match(scope["path"], method=scope["method"])
+        except (HTTPException, RoutingException):
+            return False
+        return True
+
+
+def create_asgi_app(test_config: dict | None = None) -> ReadWriteDispatcher:
+    """Build the ASGI entry point on top of the regular Flask application."""
+    wsgi_app = create_app(test_config)
+
+    read_app = Quart(__name__, static_folder=None)
+
+    engine = create_async_engine(
+        wsgi_app.config.get("ASYNC_DATABASE_URI")
+        or async_database_uri(wsgi_app.config["SQLALCHEMY_DATABASE_URI"], wsgi_app.instance_path)
+    )
+    read_app.extensions["async_engine"] = engine
+    read_app.extensions["async_session"] = async_sessionmaker(engine, expire_on_commit=False)
+    # Share one cache with the Flask side so both halves see the same rates.
+    read_app.extensions["rate_cache"] = wsgi_app.extensions["rate_cache"]
+
+    @read_app.after_serving
+    async def dispose_engine() -> None:
+        await engine.dispose()
+
+    read_app.register_blueprint(bp)
+    return ReadWriteDispatcher(read_app, wsgi_app)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import csv
 import json
 from datetime import date, timedelta
 from decimal import Decimal
@@ -7,9 +8,11 @@ from decimal import Decimal
 import click
 from flask import current_app
 from flask.cli import with_appcontext
+from sqlalchemy import inspect, text
 
 from . import db
-from .models import Debt, Expense, Income, Source
+from .models import BASE_CURRENCY, Debt, ExchangeRate, Expense, Income, Source
+from .validation import parse_amount, parse_currency, parse_date
 
 
 @click.command("init-db")
@@ -30,6 +33,65 @@ def init_db_command() -> None:
     click.echo("Database initialized with sample records.")
 
 
+@click.command("upgrade-db")
+@with_appcontext
+def upgrade_db_command() -> None:
+    """Bring an existing database up to the current schema without losing data."""
+    db.create_all()
+
+    inspector = inspect(db.engine)
+    with db.engine.begin() as connection:
+        for model in (Expense, Income, Debt):
+            table = model.__tablename__
+            columns = {column["name"] for column in inspector.get_columns(table)}
+            if "currency" in columns:
+                continue
+            connection.execute(
+                text(
+                    f"ALTER TABLE {table} ADD COLUMN currency VARCHAR(3) "
+                    f"NOT NULL DEFAULT '{BASE_CURRENCY}'"
+                )
+            )
+            click.echo(f"Added {table}.currency column.")
+    click.echo("Database schema is up to date.")
+
+
+@click.command("import-rates")
+@click.argument("csv_path", type=click.Path(exists=True, dir_okay=False))
+@with_appcontext
+def import_rates_command(csv_path: str) -> None:
+    """Import historical exchange rates from a ``date,currency,rate`` CSV file."""
+    existing = {
+        (rate.currency, rate.rate_date): rate for rate in ExchangeRate.query.all()
+    }
+    imported = 0
+    with open(csv_path, newline="", encoding="utf-8") as handle:
+        for line_number, row in enumerate(csv.DictReader(handle), start=2):
+            rate_date = parse_date(row.get("date"))
+            currency = parse_currency(row.get("currency"))
+            rate = parse_amount(row.get("rate"))
+            if (
+                rate_date is None
+                or currency is None
+                or rate is None
+                or not rate.is_finite()
+                or rate <= 0
+            ):
+                raise click.ClickException(f"Invalid rate row at {csv_path}:{line_number}")
+
+            record = existing.get((currency, rate_date))
+            if record is None:
+                record = ExchangeRate(currency=currency, rate_date=rate_date, rate=rate)
+                existing[(currency, rate_date)] = record
+                db.session.add(record)
+            else:
+                record.rate = rate
+            imported += 1
+
+    db.session.commit()
+    click.echo(f"Imported {imported} exchange rates.")
+
+
 def seed_sources() -> None:
     sources = [
         Source(name="Kredi Kartı", type="credit_card"),
@@ -119,3 +181,5 @@ def seed_debts() -> None:
 
 def register_cli(app) -> None:
     app.cli.add_command(init_db_command)
+    app.cli.add_command(upgrade_db_command)
+    app.cli.add_command(import_rates_command)
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+from flask import current_app
+from sqlalchemy import Select, func, select
+
+from . import db
+from .models import BASE_CURRENCY, ExchangeRate
+from .validation import parse_currency
+
+ONE = Decimal(1)
+CENT = Decimal("0.01")
+
+
+class ConversionError(Exception):
+    """Raised when an amount cannot be converted to the requested currency."""
+
+
+class RateNotFoundError(ConversionError):
+    """Raised when no rate is known for a currency on or before a date."""
+
+
+class RateCache:
+    """In-memory copy of the exchange rate table.
+
+    Every currency's series is kept as two parallel lists sorted by date, so an
+    "as of" lookup is a single bisect instead of a database query. The copy is
+    tagged with the table's ``rate_version_query`` stamp and rebuilt whenever the
+    stamp read by a request differs, so rates imported by another process are
+    picked up without a restart.
+    """
+
+    def __init__(self) -> None:
+        self._series: dict[str, tuple[list[date], list[Decimal]]] = {}
+        self._version: tuple[Any, ...] | None = None
+
+    def is_current(self, version: tuple[Any, ...]) -> bool:
+        return self._version == version
+
+    def fill(self, rows: Iterable[tuple[str, date, Decimal]], version: tuple[Any, ...]) -> None:
+        """Build the series from rows ordered as returned by ``rate_series_query``."""
+        series: dict[str, tuple[list[date], list[Decimal]]] = {}
+        for currency, rate_date, rate in rows:
+            dates, rates = series.setdefault(currency, ([], []))
+            dates.append(rate_date)
+            rates.append(rate)
+        self._series, self._version = series, version
+
+    def rate(self, currency: str, on: date) -> Decimal:
+        """Return the latest rate of ``currency`` in ``BASE_CURRENCY`` on or before ``on``."""
+        if currency == BASE_CURRENCY:
+            return ONE
+        series = self._series.get(currency)
+        if series is not None:
+            dates, rates = series
+            index = bisect_right(dates, on)
+            if index:
+                return rates[index - 1]
+        raise RateNotFoundError(f"{currency} için {on.isoformat()} tarihinde kur bulunamadı")
+
+    def factor(self, source: str, target: str, on: date) -> Decimal:
+        if source == target:
+            return ONE
+        return self.rate(source, on) / self.rate(target, on)
+
+    def convert_many(
+        self, items: Iterable[tuple[Decimal, str, date]], target: str
+    ) -> list[Decimal]:
+        """Convert ``(amount, currency, date)`` triples to ``target`` in one pass.
+
+        Factors are computed once per distinct ``(currency, date)`` pair, so the
+        cost grows with the number of rate points touched rather than with rows.
+        """
+        factors: dict[tuple[str, date], Decimal] = {}
+        converted: list[Decimal] = []
+        for amount, currency, on in items:
+            key = (currency, on)
+            factor = factors.get(key)
+            if factor is None:
+                factor = factors[key] = self.factor(currency, target, on)
+            converted.append(amount * factor)
+        return converted
+
+
+def rate_series_query() -> Select:
+    return select(ExchangeRate.currency, ExchangeRate.rate_date, ExchangeRate.rate).order_by(
+        ExchangeRate.currency, ExchangeRate.rate_date
+    )
+
+
+def rate_version_query() -> Select:
+    """Cheap stamp of the rate table; any insert, update or delete changes it.
+
+    ``updated_at`` is set on every insert and on every update that changes a
+    rate, so corrections that keep the row count and the sum still move the
+    stamp; deletions change the count.
+    """
+    return select(func.count(ExchangeRate.id), func.max(ExchangeRate.updated_at))
+
+
+def get_rate_cache() -> RateCache:
+    """Return the app's rate cache, reloading it if the rate table has changed."""
+    cache: RateCache = current_app.extensions["rate_cache"]
+    version = tuple(db.session.execute(rate_version_query()).one())
+    if not cache.is_current(version):
+        cache.fill(db.session.execute(rate_series_query()), version)
+    return cache
+
+
+def round_amount(value: Decimal) -> Decimal:
+    return value.quantize(CENT)
+
+
+def conversion_target(args: Mapping[str, str]) -> str | None:
+    """Return the validated ``convert_to`` query argument, if any."""
+    value = args.get("convert_to")
+    if value is None:
+        return None
+    target = parse_currency(value)
+    if target is None:
+        raise ConversionError("convert_to değeri geçersiz")
+    return target
+
+
+def serialize_records(
+    records: list[Any], date_attr: str, target: str | None, cache: RateCache | None
+) -> list[dict[str, Any]]:
+    """Serialize records, adding a ``converted`` amount when ``target`` is set."""
+    payload = [record.to_dict() for record in records]
+    if target is None or cache is None:
+        return payload
+    today = date.today()
+    converted = cache.convert_many(
+        ((record.amount, record.currency, getattr(record, date_attr) or today) for record in records),
+        target,
+    )
+    for item, amount in zip(payload, converted):
+        item["converted"] = {"amount": float(round_amount(amount)), "currency": target}
+    return payload
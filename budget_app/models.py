@@ -1,15 +1,27 @@
 from __future__ import annotations
 
 import json
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
 from typing import Any
 
-from sqlalchemy import CheckConstraint, Date, ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy import (
+    CheckConstraint,
+    Date,
+    DateTime,
+    ForeignKey,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from . import db
 
+BASE_CURRENCY = "TRY"
+
 
 class Source(db.Model):
     __tablename__ = "sources"
@@ -33,6 +45,9 @@ class Expense(db.Model):
     id: Mapped[int] = mapped_column(primary_key=True)
     description: Mapped[str] = mapped_column(String(255), nullable=False)
     amount: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+    currency: Mapped[str] = mapped_column(
+        String(3), nullable=False, default=BASE_CURRENCY, server_default=BASE_CURRENCY
+    )
     date: Mapped[date] = mapped_column(Date, nullable=False)
     category: Mapped[str | None] = mapped_column(String(100))
     notes: Mapped[str | None] = mapped_column(Text)
@@ -50,6 +65,7 @@ class Expense(db.Model):
             "id": self.id,
             "description": self.description,
             "amount": float(self.amount),
+            "currency": self.currency,
             "date": self.date.isoformat(),
             "category": self.category,
             "source": self.source.to_dict() if self.source else None,
@@ -92,6 +108,9 @@ class Income(db.Model):
     id: Mapped[int] = mapped_column(primary_key=True)
     source: Mapped[str] = mapped_column(String(120), nullable=False)
     amount: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+    currency: Mapped[str] = mapped_column(
+        String(3), nullable=False, default=BASE_CURRENCY, server_default=BASE_CURRENCY
+    )
     received_date: Mapped[date] = mapped_column(Date, nullable=False)
     category: Mapped[str | None] = mapped_column(String(100))
     notes: Mapped[str | None] = mapped_column(Text)
@@ -101,6 +120,7 @@ class Income(db.Model):
             "id": self.id,
             "source": self.source,
             "amount": float(self.amount),
+            "currency": self.currency,
             "received_date": self.received_date.isoformat(),
             "category": self.category,
             "notes": self.notes,
@@ -113,6 +133,9 @@ class Debt(db.Model):
     id: Mapped[int] = mapped_column(primary_key=True)
     creditor: Mapped[str] = mapped_column(String(120), nullable=False)
     amount: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+    currency: Mapped[str] = mapped_column(
+        String(3), nullable=False, default=BASE_CURRENCY, server_default=BASE_CURRENCY
+    )
     due_date: Mapped[date | None] = mapped_column(Date)
     status: Mapped[str | None] = mapped_column(String(30))
     notes: Mapped[str | None] = mapped_column(Text)
@@ -122,7 +145,26 @@ class Debt(db.Model):
             "id": self.id,
             "creditor": self.creditor,
             "amount": float(self.amount),
+            "currency": self.currency,
             "due_date": self.due_date.isoformat() if self.due_date else None,
             "status": self.status,
             "notes": self.notes,
         }
+
+
+class ExchangeRate(db.Model):
+    """Historical rate of one unit of ``currency`` expressed in ``BASE_CURRENCY``."""
+
+    __tablename__ = "exchange_rates"
+    __table_args__ = (
+        UniqueConstraint("currency", "rate_date", name="exchange_rate_currency_date"),
+        CheckConstraint("rate > 0", name="exchange_rate_positive"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    currency: Mapped[str] = mapped_column(String(3), nullable=False)
+    rate_date: Mapped[date] = mapped_column(Date, nullable=False)
+    rate: Mapped[Decimal] = mapped_column(Numeric(18, 6), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
@@ -1,13 +1,29 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from decimal import Decimal, InvalidOperation
+from decimal import Decimal
 from typing import Any
 
 from flask import Blueprint, jsonify, request
+from sqlalchemy import func, select
 
 from . import db
-from .models import Debt, Expense, Income, Source
+from .currency import (
+    ConversionError,
+    conversion_target,
+    get_rate_cache,
+    round_amount,
+    serialize_records,
+)
+from .models import BASE_CURRENCY, Debt, Expense, Income, Source
+from .validation import (
+    parse_amount,
+    parse_currency,
+    parse_date,
+    parse_year,
+    validate_installment,
+    validate_splits,
+)
 
 bp = Blueprint("api", __name__)
 
@@ -27,11 +43,64 @@ def index() -> Any:
                 "POST /debts": "Yeni borç kaydı ekler",
                 "GET /incomes": "Gelirleri listeler",
                 "POST /incomes": "Yeni gelir kaydı ekler",
+                "GET /summary": "Gelir, harcama ve borç toplamlarını döndürür",
             },
         }
     )
 
 
+@bp.errorhandler(ConversionError)
+def conversion_error(error: ConversionError) -> Any:
+    return jsonify({"error": str(error)}), 400
+
+
+@bp.get("/summary")
+def summary() -> Any:
+    """Return totals per currency, or in a single currency when ``convert_to`` is set.
+
+    Amounts are summed in SQL per currency (and per date when converting), so a
+    converted total only needs one rate per distinct currency and day.
+    """
+    target = conversion_target(request.args)
+    year = parse_year(request.args.get("year"))
+    if "year" in request.args and year is None:
+        return jsonify({"error": "year değeri geçersiz"}), 400
+    today = date.today()
+    cache = get_rate_cache() if target is not None else None
+
+    totals: dict[str, Any] = {"year": year}
+    for key, model, date_column in (
+        ("incomes", Income, Income.received_date),
+        ("expenses", Expense, Expense.date),
+        ("debts", Debt, Debt.due_date),
+    ):
+        if target is None:
+            query = select(model.currency, func.sum(model.amount)).group_by(model.currency)
+        else:
+            query = select(model.currency, date_column, func.sum(model.amount)).group_by(
+                model.currency, date_column
+            )
+        if year is not None:
+            query = query.where(date_column.between(date(year, 1, 1), date(year, 12, 31)))
+        rows = db.session.execute(query).all()
+
+        if target is None:
+            totals[key] = {
+                currency: float(round_amount(Decimal(str(total)))) for currency, total in rows
+            }
+        else:
+            converted = cache.convert_many(
+                (
+                    (Decimal(str(total)), currency, row_date or today)
+                    for currency, row_date, total in rows
+                ),
+                target,
+            )
+            totals[key] = {target: float(round_amount(sum(converted, Decimal(0))))}
+
+    return jsonify(totals)
+
+
 @bp.route("/sources", methods=["GET", "POST"])
 def sources() -> Any:
     if request.method == "GET":
@@ -72,8 +141,10 @@ def source_detail(source_id: int) -> Any:
 @bp.route("/expenses", methods=["GET", "POST"])
 def expenses() -> Any:
     if request.method == "GET":
+        target = conversion_target(request.args)
         all_expenses = Expense.query.order_by(Expense.date.desc()).all()
-        return jsonify([expense.to_dict() for expense in all_expenses])
+        cache = get_rate_cache() if target is not None else None
+        return jsonify(serialize_records(all_expenses, "date", target, cache))
 
     data = request.get_json(silent=True) or {}
     description = data.get("description")
@@ -82,6 +153,7 @@ def expenses() -> Any:
     category = data.get("category")
     notes = data.get("notes")
     source_id = data.get("source_id")
+    currency = parse_currency(data.get("currency", BASE_CURRENCY))
 
     if not description or amount is None or source_id is None:
         return (
@@ -89,6 +161,9 @@ def expenses() -> Any:
             400,
         )
 
+    if currency is None:
+        return jsonify({"error": "currency değeri geçersiz"}), 400
+
     source = Source.query.get(source_id)
     if source is None:
         return jsonify({"error": "Geçersiz kaynak"}), 400
@@ -96,6 +171,7 @@ def expenses() -> Any:
     expense = Expense(
         description=description,
         amount=amount,
+        currency=currency,
         date=date_value,
         category=category,
         notes=notes,
@@ -144,6 +220,11 @@ def expense_detail(expense_id: int) -> Any:
         if amount is None:
             return jsonify({"error": "amount değeri geçersiz"}), 400
         expense.amount = amount
+    if "currency" in data:
+        currency = parse_currency(data["currency"])
+        if currency is None:
+            return jsonify({"error": "currency değeri geçersiz"}), 400
+        expense.currency = currency
     if "date" in data:
         date_value = parse_date(data["date"])
         if date_value is None:
@@ -188,8 +269,10 @@ def expense_detail(expense_id: int) -> Any:
 @bp.route("/incomes", methods=["GET", "POST"])
 def incomes() -> Any:
     if request.method == "GET":
+        target = conversion_target(request.args)
         all_incomes = Income.query.order_by(Income.received_date.desc()).all()
-        return jsonify([income.to_dict() for income in all_incomes])
+        cache = get_rate_cache() if target is not None else None
+        return jsonify(serialize_records(all_incomes, "received_date", target, cache))
 
     data = request.get_json(silent=True) or {}
     source = data.get("source")
@@ -197,13 +280,17 @@ def incomes() -> Any:
     received_date = parse_date(data.get("received_date")) or datetime.utcnow().date()
     category = data.get("category")
     notes = data.get("notes")
+    currency = parse_currency(data.get("currency", BASE_CURRENCY))
 
     if not source or amount is None:
         return jsonify({"error": "source ve amount alanları gereklidir"}), 400
+    if currency is None:
+        return jsonify({"error": "currency değeri geçersiz"}), 400
 
     income = Income(
         source=source,
         amount=amount,
+        currency=currency,
         received_date=received_date,
         category=category,
         notes=notes,
@@ -235,6 +322,11 @@ def income_detail(income_id: int) -> Any:
         if amount is None:
             return jsonify({"error": "amount değeri geçersiz"}), 400
         income.amount = amount
+    if "currency" in data:
+        currency = parse_currency(data["currency"])
+        if currency is None:
+            return jsonify({"error": "currency değeri geçersiz"}), 400
+        income.currency = currency
     if "received_date" in data:
         received_date = parse_date(data["received_date"])
         if received_date is None:
@@ -252,8 +344,10 @@ def income_detail(income_id: int) -> Any:
 @bp.route("/debts", methods=["GET", "POST"])
 def debts() -> Any:
     if request.method == "GET":
+        target = conversion_target(request.args)
         all_debts = Debt.query.order_by(Debt.due_date.is_(None), Debt.due_date).all()
-        return jsonify([debt.to_dict() for debt in all_debts])
+        cache = get_rate_cache() if target is not None else None
+        return jsonify(serialize_records(all_debts, "due_date", target, cache))
 
     data = request.get_json(silent=True) or {}
     creditor = data.get("creditor")
@@ -261,13 +355,17 @@ def debts() -> Any:
     due_date = parse_date(data.get("due_date"))
     status = data.get("status")
     notes = data.get("notes")
+    currency = parse_currency(data.get("currency", BASE_CURRENCY))
 
     if not creditor or amount is None:
         return jsonify({"error": "creditor ve amount alanları gereklidir"}), 400
+    if currency is None:
+        return jsonify({"error": "currency değeri geçersiz"}), 400
 
     debt = Debt(
         creditor=creditor,
         amount=amount,
+        currency=currency,
         due_date=due_date,
         status=status,
         notes=notes,
@@ -299,6 +397,11 @@ def debt_detail(debt_id: int) -> Any:
         if amount is None:
             return jsonify({"error": "amount değeri geçersiz"}), 400
         debt.amount = amount
+    if "currency" in data:
+        currency = parse_currency(data["currency"])
+        if currency is None:
+            return jsonify({"error": "currency değeri geçersiz"}), 400
+        debt.currency = currency
     if "due_date" in data:
         due_date = parse_date(data["due_date"])
         if due_date is None:
@@ -312,73 +415,3 @@ def debt_detail(debt_id: int) -> Any:
     db.session.commit()
     return jsonify(debt.to_dict())
 
-
-def parse_amount(value: Any) -> Decimal | None:
-    if value is None:
-        return None
-    try:
-        return Decimal(str(value))
-    except (InvalidOperation, ValueError, TypeError):
-        return None
-
-
-def parse_date(value: Any) -> date | None:
-    if value is None:
-        return None
-    if isinstance(value, date) and not isinstance(value, datetime):
-        return value
-    if isinstance(value, datetime):
-        return value.date()
-    if isinstance(value, str):
-        try:
-            return datetime.fromisoformat(value).date()
-        except ValueError:
-            try:
-                return datetime.strptime(value, "%Y-%m-%d").date()
-            except ValueError:
-                return None
-    if isinstance(value, (int, float)):
-        try:
-            return datetime.fromtimestamp(value).date()
-        except (ValueError, OSError, OverflowError):
-            return None
-    return None
-
-
-def validate_splits(splits: Any) -> list[dict[str, Any]] | None:
-    if not isinstance(splits, list):
-        return None
-    cleaned: list[dict[str, Any]] = []
-    for item in splits:
-        if not isinstance(item, dict):
-            return None
-        name = item.get("name")
-        amount = parse_amount(item.get("amount"))
-        if not name or amount is None:
-            return None
-        cleaned.append({"name": name, "amount": float(amount)})
-    return cleaned
-
-
-def validate_installment(installment: Any) -> dict[str, Any] | None:
-    if not isinstance(installment, dict):
-        return None
-    count = installment.get("count")
-    number = installment.get("number")
-    amount = parse_amount(installment.get("amount"))
-
-    if count is None or number is None:
-        return None
-    try:
-        count_int = int(count)
-        number_int = int(number)
-    except (TypeError, ValueError):
-        return None
-    if count_int <= 0 or number_int <= 0 or number_int > count_int:
-        return None
-
-    return {
-        "count": count_int,
-        "number": number_int,
-        "amount": amount if amount is not None else None,
-    }
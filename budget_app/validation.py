@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from datetime import MAXYEAR, MINYEAR, date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+
+def parse_amount(value: Any) -> Decimal | None:
+    if value is None:
+        return None
+    try:
+        return Decimal(str(value))
+    except (InvalidOperation, ValueError, TypeError):
+        return None
+
+
+def parse_date(value: Any) -> date | None:
+    if value is None:
+        return None
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return value
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value).date()
+        except ValueError:
+            try:
+                return datetime.strptime(value, "%Y-%m-%d").date()
+            except ValueError:
+                return None
+    if isinstance(value, (int, float)):
+        try:
+            return datetime.fromtimestamp(value).date()
+        except (ValueError, OSError, OverflowError):
+            return None
+    return None
+
+
+def parse_currency(value: Any) -> str | None:
+    if not isinstance(value, str):
+        return None
+    code = value.strip().upper()
+    if len(code) != 3 or not (code.isascii() and code.isalpha()):
+        return None
+    return code
+
+
+def parse_year(value: Any) -> int | None:
+    if value is None:
+        return None
+    try:
+        year = int(value)
+    except (TypeError, ValueError):
+        return None
+    if year < MINYEAR or year > MAXYEAR:
+        return None
+    return year
+
+
+def validate_splits(splits: Any) -> list[dict[str, Any]] | None:
+    if not isinstance(splits, list):
+        return None
+    cleaned: list[dict[str, Any]] = []
+    for item in splits:
+        if not isinstance(item, dict):
+            return None
+        name = item.get("name")
+        amount = parse_amount(item.get("amount"))
+        if not name or amount is None:
+            return None
+        cleaned.append({"name": name, "amount": float(amount)})
+    return cleaned
+
+
+def validate_installment(installment: Any) -> dict[str, Any] | None:
+    if not isinstance(installment, dict):
+        return None
+    count = installment.get("count")
+    number = installment.get("number")
+    amount = parse_amount(installment.get("amount"))
+
+    if count is None or number is None:
+        return None
+    try:
+        count_int = int(count)
+        number_int = int(number)
+    except (TypeError, ValueError):
+        return None
+    if count_int <= 0 or number_int <= 0 or number_int > count_int:
+        return None
+
+    return {
+        "count": count_int,
+        "number": number_int,
+        "amount": amount if amount is not None else None,
+    }